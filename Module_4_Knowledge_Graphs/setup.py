@@ -122,9 +122,31 @@ def load_dataset():
         return False
 
 
+def create_indexes():
+    """Create indexes so the app's startup existence checks are O(1)."""
+    print("🗂️  Step 4: Creating indexes...")
+
+    try:
+        rag = Neo4jGraphRAG()
+
+        rag.execute_query(
+            "CREATE INDEX article_emb_exists IF NOT EXISTS "
+            "FOR (a:Article) ON (a.embedding)"
+        )
+
+        print("✅ Indexes created!\n")
+
+        rag.close()
+        return True
+
+    except Exception as e:
+        print(f"❌ Failed to create indexes: {str(e)}")
+        return False
+
+
 def create_embeddings():
     """Create embeddings for articles."""
-    print("🔢 Step 4: Creating embeddings for articles...")
+    print("🔢 Step 5: Creating embeddings for articles...")
     print("   (This may take 2-3 minutes...)\n")
 
     try:
@@ -163,7 +185,7 @@ def create_embeddings():
 
 def test_queries():
     """Test that queries work."""
-    print("🧪 Step 5: Testing queries...")
+    print("🧪 Step 6: Testing queries...")
 
     try:
         rag = Neo4jGraphRAG()
@@ -206,6 +228,7 @@ def main():
         ("Environment Check", check_environment),
         ("Connection Test", test_connection),
         ("Dataset Loading", load_dataset),
+        ("Index Creation", create_indexes),
         ("Embedding Creation", create_embeddings),
         ("Query Testing", test_queries)
     ]
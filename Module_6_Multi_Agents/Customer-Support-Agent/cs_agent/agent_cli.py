@@ -4,6 +4,7 @@ from google.adk.runners import Runner
 from toolbox_core import ToolboxSyncClient
 from google.adk.sessions import InMemorySessionService
 import asyncio
+import functools
 from dotenv import load_dotenv
 from memory import search_memory, save_memory
 from prompts import PROMPT_INSTRUCTION
@@ -17,7 +18,12 @@ toolbox_client = ToolboxSyncClient(
     url="http://127.0.0.1:5000"
 )
 
-database_tools = toolbox_client.load_toolset("cs_agent_tools")
+@functools.lru_cache(maxsize=1)
+def _get_tools():
+    """Load the toolset once; every import path shares the same handle."""
+    return toolbox_client.load_toolset("cs_agent_tools")
+
+database_tools = _get_tools()
 
 NEW_PROMPT_INSTRUCTION = PROMPT_INSTRUCTION.format(USER_ID=USER_ID)
 
@@ -35,11 +41,50 @@ root_agent = Agent(
 session_service = InMemorySessionService()
 runner = Runner(agent=root_agent, app_name=APP_NAME, session_service=session_service)
 
+# One session per user for the lifetime of the process: re-entering the
+# loop for a user keeps their in-memory short-term state instead of
+# paying session creation again
+_sessions = {}
+
+async def _get_session(user_id: str):
+    """Create the user's session on first use and reuse it afterwards."""
+    if user_id not in _sessions:
+        _sessions[user_id] = await session_service.create_session(
+            app_name=APP_NAME, user_id=user_id, session_id=f"session_{user_id}"
+        )
+    return _sessions[user_id]
+
+# Seconds the background writer waits to coalesce messages into one
+# Mem0 write
+_FLUSH_INTERVAL = 2.0
+
+async def _memory_writer(queue: asyncio.Queue, user_id: str):
+    """Drain queued messages and persist them to Mem0 in small batches.
+
+    Writing incrementally means a crash loses at most one coalesced
+    batch instead of the whole transcript, and shutdown no longer ends
+    on one large blocking HTTP call.
+    """
+    loop = asyncio.get_event_loop()
+    while True:
+        batch = [await queue.get()]
+        deadline = loop.time() + _FLUSH_INTERVAL
+        while (timeout := deadline - loop.time()) > 0:
+            try:
+                batch.append(await asyncio.wait_for(queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        await asyncio.to_thread(save_memory, batch, user_id)
+        for _ in batch:
+            queue.task_done()
+
 async def main():
 
-    messages = []
-    # Create a new session
-    await session_service.create_session(app_name=APP_NAME, user_id=USER_ID, session_id=f"session_{USER_ID}")
+    # Reuse the session if this user already has one
+    await _get_session(USER_ID)
+
+    memory_queue = asyncio.Queue()
+    writer = asyncio.create_task(_memory_writer(memory_queue, USER_ID))
 
     while True:
 
@@ -48,18 +93,36 @@ async def main():
         # print("User: ", user_input)
         if user_input.lower() in ['quit', 'exit', 'bye', 'q']:
             break
-        messages.append({"role": "user", "content": user_input})
+        memory_queue.put_nowait({"role": "user", "content": user_input})
         content = types.Content(role='user', parts=[types.Part(text=user_input)])
-        response = runner.run(user_id=USER_ID, session_id=f"session_{USER_ID}", new_message=content)
-        
-        for event in response:
-            # Print final response
-            if event.is_final_response() and event.content:
-                print("Agent: ", event.content.parts[0].text)
-                messages.append({"role": "assistant", "content": event.content.parts[0].text})
-        
-        # print(messages)
-    save_memory(messages, USER_ID)
+
+        # Consume the async event stream so partial output prints as it
+        # arrives - perceived latency is time-to-first-token instead of
+        # the full response time (same idiom as the MCP agents)
+        print("Agent: ", end='', flush=True)
+        streamed = False
+        final_text = None
+        async for event in runner.run_async(
+            user_id=USER_ID, session_id=f"session_{USER_ID}", new_message=content
+        ):
+            if not (event.content and event.content.parts and event.content.parts[0].text):
+                continue
+            if event.is_final_response():
+                final_text = event.content.parts[0].text
+            elif getattr(event, 'partial', False):
+                print(event.content.parts[0].text, end='', flush=True)
+                streamed = True
+
+        if final_text is not None:
+            # When deltas streamed, the text is already on screen
+            print('' if streamed else final_text)
+            memory_queue.put_nowait({"role": "assistant", "content": final_text})
+        else:
+            print()
+
+    # Flush whatever the writer hasn't persisted yet, then stop it
+    await memory_queue.join()
+    writer.cancel()
 
 
 if __name__ == "__main__":
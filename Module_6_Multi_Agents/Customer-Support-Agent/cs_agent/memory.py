@@ -1,32 +1,153 @@
 from mem0 import MemoryClient
 from dotenv import load_dotenv
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import os
+import re
+import time
 
 load_dotenv()
 
 mem0 = MemoryClient(api_key=os.getenv("MEM0_API_KEY"))
 
+# Retry bounds for Mem0 API calls: transient failures (429s, network
+# blips) get a couple of backed-off retries, but a persistently failing
+# call gives up quickly instead of stalling the agent turn
+_MAX_ATTEMPTS = 3
+_RETRY_BASE_DELAY = 1.0
+
+def _call_with_retries(call):
+    """Run a Mem0 API call with bounded retries and exponential backoff."""
+    delay = _RETRY_BASE_DELAY
+    for attempt in range(_MAX_ATTEMPTS):
+        try:
+            return call()
+        except Exception:
+            if attempt == _MAX_ATTEMPTS - 1:
+                raise
+            time.sleep(delay)
+            delay *= 2
+
+# Search-result cache: agent turns within a session often repeat
+# near-identical memory lookups, and each one is a full API round-trip.
+# Entries are keyed by (user_id, normalized query), expire after
+# _CACHE_TTL seconds, and are dropped for a user whenever that user's
+# memory changes via save_memory.
+_CACHE_TTL = 60
+_CACHE_MAX_ENTRIES = 1024
+_search_cache = OrderedDict()
+
+def _cache_invalidate(user_id: str):
+    """Drop cached search results and the mirror for one user."""
+    for key in [k for k in _search_cache if k[0] == user_id]:
+        del _search_cache[key]
+    _user_memories.pop(user_id, None)
+
+# Local per-user memory mirror: a user's working set is small (tens to
+# hundreds of memories) but searched repeatedly, and each remote search
+# re-embeds the query and scans the store server-side. We bulk-fetch the
+# user's memories once per _MIRROR_TTL and answer repeat searches from
+# the mirror with token-overlap scoring, falling back to the remote
+# semantic search when the mirror has no confident match. (Mem0's API
+# does not expose its embeddings, so the mirror scores lexically rather
+# than maintaining a local vector index.)
+_MIRROR_TTL = 300
+_MIRROR_MIN_OVERLAP = 2
+_user_memories = {}
+
+_WORD_RE = re.compile(r"[a-z0-9]{3,}")
+
+def _mirror_for(user_id: str):
+    """Return the user's mirrored memories, refreshing when stale."""
+    cached = _user_memories.get(user_id)
+    if cached is not None and time.time() - cached[0] < _MIRROR_TTL:
+        return cached[1]
+    try:
+        memories = _call_with_retries(
+            lambda: mem0.get_all(filters={"user_id": user_id})
+        )
+    except Exception:
+        return None
+    entries = [
+        (mem['memory'], frozenset(_WORD_RE.findall(mem['memory'].lower())))
+        for mem in memories.get('results', [])
+        if mem.get('memory')
+    ]
+    _user_memories[user_id] = (time.time(), entries)
+    return entries
+
+def _local_search(query: str, user_id: str):
+    """Serve a search from the local mirror, or None when unconfident."""
+    entries = _mirror_for(user_id)
+    if not entries:
+        return None
+    query_tokens = frozenset(_WORD_RE.findall(query.lower()))
+    scored = sorted(
+        ((len(query_tokens & tokens), text) for text, tokens in entries),
+        reverse=True,
+    )
+    top = [(score, text) for score, text in scored[:10] if score >= _MIRROR_MIN_OVERLAP]
+    if not top:
+        return None
+    memory_context = "\n".join(f"- {text}" for _, text in top)
+    return {"status": "success", "memories": memory_context}
+
 # Define memory function tools
 def search_memory(query: str, user_id: str) -> dict:
     """Search through past conversations and memories"""
+    cache_key = (user_id, query.strip().lower())
+    cached = _search_cache.get(cache_key)
+    if cached is not None and time.time() - cached[0] < _CACHE_TTL:
+        _search_cache.move_to_end(cache_key)
+        return cached[1]
+
+    # Try the local mirror first - no network on a confident hit
+    local = _local_search(query, user_id)
+    if local is not None:
+        _search_cache[cache_key] = (time.time(), local)
+        if len(_search_cache) > _CACHE_MAX_ENTRIES:
+            _search_cache.popitem(last=False)
+        return local
+
     # For Platform API, user_id goes in filters
     filters = {"user_id": user_id}
-    memories = mem0.search(query, filters=filters)
+    try:
+        memories = _call_with_retries(lambda: mem0.search(query, filters=filters))
+    except Exception as e:
+        return {"status": "error", "message": f"Memory search failed: {str(e)}"}
     if memories.get('results', []):
         memory_list = memories['results']
         memory_context = "\n".join([f"- {mem['memory']}" for mem in memory_list])
-        return {"status": "success", "memories": memory_context}
-    return {"status": "no_memories", "message": "No relevant memories found"}
+        result = {"status": "success", "memories": memory_context}
+    else:
+        result = {"status": "no_memories", "message": "No relevant memories found"}
+
+    _search_cache[cache_key] = (time.time(), result)
+    if len(_search_cache) > _CACHE_MAX_ENTRIES:
+        _search_cache.popitem(last=False)
+    return result
+
+def search_memory_many(queries: list, user_id: str) -> list:
+    """Run several memory searches concurrently for one user.
+
+    Each search is network-bound, so fanning out over a small thread
+    pool makes a turn that needs multiple lookups cost one round-trip
+    instead of their sum.
+    """
+    with ThreadPoolExecutor(max_workers=min(8, len(queries) or 1)) as executor:
+        return list(executor.map(lambda q: search_memory(q, user_id), queries))
 
 def save_memory(messages, user_id: str) -> dict:
     """Save important information to memory
-    
+
     Args:
         content: Can be a string or a list of message dicts with 'role' and 'content' keys
         user_id: The user's unique identifier
     """
     try:
-        result = mem0.add(messages, user_id=user_id)
+        result = _call_with_retries(lambda: mem0.add(messages, user_id=user_id))
+        # The user's memories just changed; stale search hits must go
+        _cache_invalidate(user_id)
         return {"status": "success", "message": "Information saved to memory", "result": result}
     except Exception as e:
-        return {"status": "error", "message": f"Failed to save memory: {str(e)}"}
\ No newline at end of file
+        return {"status": "error", "message": f"Failed to save memory: {str(e)}"}